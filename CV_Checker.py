@@ -10,34 +10,77 @@ This file uses LLM models to compare CVs with the Job advertisements.
 Various LLM models can be selected for the comparisons. Also, zero-shot or one-shot learning can be chosen too.
 
 Functions:
+- _model_names(): Reads the list of available free models, once per process.
 - parse_argument(): Parses command-line arguments and returns them as a namespace object.
 - payload(text, client, example, model, mode): Feeds a prompt to an LLM model for the evaluation.
+- clean_web_text(text): Drops boilerplate lines from the extracted page text and bounds its length.
+- get_browser(): Lazily launches one shared browser and returns its context.
+- close_browser(): Closes the shared browser once all pages are done.
 - run_playwright(url): Extracts information from the webpage.
 - json_writer(): Writs a json file of the examples.
 - json_loader(file_address): Reads the json file examples.
+- process(url, client, model_examples, my_cv, model_type, semaphore): Evaluates one job position against the CV.
+- main(): Runs the whole comparison pipeline.
 
 Requirements:
 ------
 - pymupdf4llm
 - playwright
+- httpx
 - openai
 - os
 - requests
-- json
+- orjson
 - argparse
+- asyncio
+- hashlib
+- shutil
+- aiolimiter
+- diskcache
+- tenacity
 
 Notes:
 ------
 - The CV address can be also a URL.
 """
 import pymupdf4llm
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import httpx
 import openai
 
+import asyncio
+import functools
+import hashlib
 import os
+import re
+import shutil
 import requests
-import json
+import orjson
 import argparse
+from pathlib import Path
+
+import aiolimiter
+import diskcache
+import tenacity
+
+import llm_cache
+
+@functools.lru_cache(maxsize=1)
+def _model_names():
+    '''
+    Reading the list of available free models, once per process.
+
+    Parameters:
+    -----
+        None
+
+    Returns:
+    -----
+        tuple: The model names from free_model_names.txt.
+    '''
+    # The file is resolved next to this script, so the script can run from any working directory.
+    names = Path(__file__).with_name('free_model_names.txt').read_text().splitlines()
+    return tuple(name.strip() for name in names if name.strip())
 
 def parse_argument():
     '''
@@ -54,29 +97,142 @@ def parse_argument():
     Example usage:
         $ python CV_Checker.py --cv 'cv.pdf' --learn_mode 'one-shot' --model_type 'google/gemma-3-27b-it:free'
         After execution, you can access the arguments as:
-        args.cv             # Path to the CV file 
+        args.cv             # Path to the CV file
         args.learn_mode     # Mode of Learning ("zero-shot", "one-shot")
         args.model_type     # Model type for comparison
+        args.url            # Job position URLs (can be repeated)
+        args.positions      # Path to a text file with one job position URL per line
+        args.api_key        # OpenRouter API key (falls back to the OPENROUTER_API_KEY environment variable)
     '''
     #list of available free models.
-    with open('free_model_names.txt', 'r') as file:
-        model_name = [line.strip() for line in file.readlines()]    
+    model_name = _model_names()
 
     parser = argparse.ArgumentParser(description='The script uses LLM models to compare CVs with the Job advertisements.')
     parser.add_argument('--cv', type= str, required= True, help= 'Path to the CV file (URL can be entered too)\nThe Acceptable formats: PDF, DOC/DOCX, XLS/XLSX, PPT/PPTX, HWP/HWPX.')
     parser.add_argument('--learn_mode', type= str, choices= ['zero-shot','one-shot'], default= 'one-shot', help= 'The learning mode for the model.')
     parser.add_argument('--model_type', type= str, choices= model_name, default= 'google/gemma-3-27b-it:free', help= 'Specify model type (choose from the available models).')
+    parser.add_argument('--url', type= str, action= 'append', help= 'A Job position URL (can be repeated to evaluate several positions concurrently).')
+    parser.add_argument('--positions', type= str, help= 'Path to a text file with one job position URL per line.')
+    parser.add_argument('--api_key', type= str, help= 'The OpenRouter API key (the OPENROUTER_API_KEY environment variable is used when omitted).')
 
     return parser.parse_args()
 
-def payload(text, client, example, model = 'google/gemma-3-27b-it:free', mode = 0):
+# Expected output structures, built once at import time and shared by every payload() call.
+# The old in-function literals carried a trailing comma that silently wrapped each dict into a 1-tuple.
+_RESP_FORMAT_INFO = {
+    "type": "json_schema",
+    "json_schema":{
+        "name": "Output",
+        "strict": True,
+        "schema":{
+            "type":"object",
+            "properties":{
+                "Requirements":{
+                    'type':'list of strings',
+                    'description': "Requirement for the job"
+                },
+                "Responsibilities":{
+                    'type':'list of strings',
+                    'description':'Future responsibilities in the job'
+                }
+            },
+            'required':['Requirements','Responsibilities'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+_RESP_FORMAT_COMPARE = {
+    "type": "json_schema",
+    "json_schema":{
+        "name": "Output",
+        "strict": True,
+        "schema":{
+            "type":"object",
+            "properties":{
+                "The Semantic Similarity Percentage":{
+                    'type':'float:.1f',
+                    'description': "the value is in Percentage"
+                },
+                "Similar keywords":{
+                    'type':'list of strings',
+                    'description':'Similar keywords between the job and CV'
+                },
+                "Different keywords":{
+                    'type':'list of strings',
+                    'description':'Different keywords between the job and CV'
+                },
+                "Similarity percentage of the keywords":{
+                    'type':'float:.1f',
+                    'description':'the value is in Percentage'
+                },
+            },
+            'required':['The Semantic Similarity Percentage','Similar keywords',
+                        'Different keywords','Similarity percentage of the keywords'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+REQUESTS_PER_MINUTE = 15 # Keeps the gather fan-out under OpenRouter's free-tier per-minute ceiling.
+
+# One shared limiter, so every payload() call counts against the same quota.
+_rate_limiter = aiolimiter.AsyncLimiter(max_rate=REQUESTS_PER_MINUTE, time_period=60)
+
+# Transient failures (429s, connection drops, 5xx) that are worth retrying with backoff.
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+# The fused structure covers the extraction fields and the comparison fields in one response,
+# so one call replaces the old extract-then-compare chain of two round trips.
+_RESP_FORMAT_FULL = {
+    "type": "json_schema",
+    "json_schema":{
+        "name": "Output",
+        "strict": True,
+        "schema":{
+            "type":"object",
+            "properties":{
+                "Requirements":{
+                    'type':'list of strings',
+                    'description': "Requirement for the job"
+                },
+                "Responsibilities":{
+                    'type':'list of strings',
+                    'description':'Future responsibilities in the job'
+                },
+                "The Semantic Similarity Percentage":{
+                    'type':'float:.1f',
+                    'description': "the value is in Percentage"
+                },
+                "Similar keywords":{
+                    'type':'list of strings',
+                    'description':'Similar keywords between the job and CV'
+                },
+                "Different keywords":{
+                    'type':'list of strings',
+                    'description':'Different keywords between the job and CV'
+                },
+                "Similarity percentage of the keywords":{
+                    'type':'float:.1f',
+                    'description':'the value is in Percentage'
+                },
+            },
+            'required':['Requirements','Responsibilities',
+                        'The Semantic Similarity Percentage','Similar keywords',
+                        'Different keywords','Similarity percentage of the keywords'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+async def payload(text, client, example, model = 'google/gemma-3-27b-it:free', mode = 0):
     '''
     Feeding a prompt to an LLM model for the evaluation.
 
     Parameters:
     -----
-        text (str): The pandas dataframe containing the data. 
-        client (openai object): An instance of the OpenAI API client.
+        text (str): The pandas dataframe containing the data.
+        client (openai object): An instance of the AsyncOpenAI API client.
         example (str): The example for the shot learning.
         model (str): The model's name.
         mode (int): The type of evaluation. Default value is 0.
@@ -87,7 +243,8 @@ def payload(text, client, example, model = 'google/gemma-3-27b-it:free', mode =
 
     Note:
     -----
-    - The options for mode are 0 or 1.
+    - The options for mode are 0, 1 or 2.
+    - Mode 2 fuses the extraction and the comparison into one call; modes 0 and 1 are kept for debugging the steps separately.
 
     '''
 
@@ -103,31 +260,10 @@ def payload(text, client, example, model = 'google/gemma-3-27b-it:free', mode =
                     Now, given the following job description, extract the 'Responsibilities' and 'Requirements' in the same format as the example above:
 
                     {text}"""}]
-        
+
         # Expected output structure.
-        response_format = {
-            "type": "json_schema",
-            "json_schema":{
-                "name": "Output",
-                "strict": True,
-                "schema":{
-                    "type":"object",
-                    "properties":{
-                        "Requirements":{
-                            'type':'list of strings',
-                            'description': "Requirement for the job"
-                        },
-                        "Responsibilities":{
-                            'type':'list of strings',
-                            'description':'Future responsibilities in the job'
-                        }
-                    },
-                    'required':['Requirements','Responsibilities'],
-                    'additionalProperties': False,
-                },
-            },
-            },
-    
+        response_format = _RESP_FORMAT_INFO
+
     elif mode == 1: # mode 1: Comparison procedure, or making a comparison of info from the CV and the extracted info from the job.
         
         # Expected message for LLM model.
@@ -141,53 +277,126 @@ def payload(text, client, example, model = 'google/gemma-3-27b-it:free', mode =
                      Now, given the following **Job Description** and **CV**, compare in the same format as the example above:
 
                      {text}"""}]
-        
+
         # Expected output structure.
-        response_format = {
-            "type": "json_schema",
-            "json_schema":{
-                "name": "Output",
-                "strict": True,
-                "schema":{
-                    "type":"object",
-                    "properties":{
-                        "The Semantic Similarity Percentage":{
-                            'type':'float:.1f',
-                            'description': "the value is in Percentage"
-                        },
-                        "Similar keywords":{
-                            'type':'list of strings',
-                            'description':'Similar keywords between the job and CV'
-                        },
-                        "Different keywords":{
-                            'type':'list of strings',
-                            'description':'Different keywords between the job and CV'
-                        },
-                        "Similarity percentage of the keywords":{
-                            'type':'float:.1f',
-                            'description':'the value is in Percentage'
-                        },
-                    },
-                    'required':['The Semantic Similarity Percentage','Similar keywords',
-                                'Different keywords','Similarity percentage of the keywords'],
-                    'additionalProperties': False,
-                },
-            },
-            },
-    
-    try:
-        completion = client.chat.completions.create(
-            model = model,
-            messages = messages,
-            response_format = response_format
-            )
-        result = completion.choices[0].message.content
-        return result
-    
-    except openai.OpenAIError as e:
-        print(f"Error occurred: {e}")
+        response_format = _RESP_FORMAT_COMPARE
+
+    elif mode == 2: # mode 2: Fused procedure, or extracting the job info and comparing it with the CV in one call.
+
+        # Expected message for LLM model.
+        messages = [{"role": "user",
+                     "content": f"""Please follow the examples below exactly as shown and do not add any extra information or details.\nIf the text is not in English, translate it to English first. First extract the 'Responsibilities' and 'Requirements' from the **Job Description**, then compare them against the **CV**.\nOnly include the similar keywords that are in both job description and CV, and only inlcude the keywords that are in the job description but not in the CV.\nReturn a single JSON containing the extracted 'Requirements' and 'Responsibilities' together with the comparison fields.
+
+                     Examples:
+
+                     {example}
+
+                     Now, given the following **Job Description** and **CV**, respond in the same format as the examples above:
 
-def run_playwright(url):
+                     {text}"""}]
+
+        # Expected output structure.
+        response_format = _RESP_FORMAT_FULL
+
+    # The same request may have been answered in an earlier run.
+    cache_key = llm_cache.make_key(model, messages, response_format)
+    cached = llm_cache.get_response(cache_key)
+    if cached is not None:
+        return cached
+
+    # Transient failures are retried with exponential backoff instead of aborting the comparison.
+    # Errors that survive the retries propagate to the caller, which reports the failing position.
+    async for attempt in tenacity.AsyncRetrying(
+            stop = tenacity.stop_after_attempt(5),
+            wait = tenacity.wait_random_exponential(min=1, max=30),
+            retry = tenacity.retry_if_exception_type(_RETRYABLE_ERRORS),
+            reraise = True):
+        with attempt:
+            async with _rate_limiter:
+                completion = await client.chat.completions.create(
+                    model = model,
+                    messages = messages,
+                    response_format = response_format
+                    )
+    result = completion.choices[0].message.content
+    llm_cache.store_response(cache_key, result)
+    return result
+
+# Page containers that usually hold the job description, tried before falling back to the whole body.
+_JOB_CONTAINER_SELECTOR = '[data-automation-id="jobPostingDescription"], main, article'
+
+# Boilerplate lines (cookie banners, footers, job-board chrome) that cost prompt tokens without adding job information.
+_BOILERPLATE_PATTERN = re.compile(
+    r'^\s*(this site uses cookies.*|accept cookies|decline|skip to main content|similar jobs.*|view all \d+ jobs|follow us|loading|©.*all rights reserved\.?)\s*$',
+    re.IGNORECASE)
+
+MAX_WEB_TEXT_CHARS = 20000 # Keeps the prompt within what the free models can handle.
+
+def clean_web_text(text):
+    '''
+    Dropping boilerplate lines from the extracted page text and bounding its length.
+
+    Parameters:
+    -----
+        text (str): The raw text extracted from the webpage.
+
+    Returns:
+    -----
+        str: The cleaned text, truncated to MAX_WEB_TEXT_CHARS.
+    '''
+    lines = [line for line in text.splitlines() if not _BOILERPLATE_PATTERN.match(line)]
+
+    return '\n'.join(lines)[:MAX_WEB_TEXT_CHARS]
+
+# The shared browser session, launched once and reused for every URL.
+_playwright = None
+_browser = None
+_context = None
+_browser_lock = asyncio.Lock() # Serializes the launch, so concurrent callers share one browser.
+
+async def get_browser():
+    '''
+    Lazily launching one shared browser and returning its context.
+
+    Parameters:
+    -----
+        None
+
+    Returns:
+    -----
+        context (playwright object): The browser context shared by all pages.
+    '''
+    global _playwright, _browser, _context
+
+    if _context is None:
+        async with _browser_lock:
+            if _context is None: # Re-checked under the lock: the first caller may have launched it while we waited.
+                _playwright = await async_playwright().start()
+                _browser = await _playwright.chromium.launch(headless=True)  # Use headless=False to see the browser
+                _context = await _browser.new_context()
+
+    return _context
+
+async def close_browser():
+    '''
+    Closing the shared browser once all pages are done.
+
+    Parameters:
+    -----
+        None
+
+    Returns:
+    -----
+        None
+    '''
+    global _playwright, _browser, _context
+
+    if _context is not None:
+        await _browser.close()
+        await _playwright.stop()
+        _playwright = _browser = _context = None
+
+async def run_playwright(url):
     '''
     Extracting information from the webpage.
 
@@ -200,17 +409,28 @@ def run_playwright(url):
         web_text (str): Extracted job description.
     '''
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)  # Use headless=False to see the browser
-        page = browser.new_page()
+    context = await get_browser()
+    page = await context.new_page()
 
-        page.goto(url)
-        page.wait_for_timeout(2000) # Wait 2 additional seconds to avoid possible problem.
-        page.wait_for_selector('body')  # Wait for the page to load
-        web_text = page.inner_text('body')  # Get the text content of the body
-        browser.close()
-    
-    return web_text
+    try:
+        await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+
+        # JS-rendered job boards inject the description after domcontentloaded, so wait for the container to show up.
+        try:
+            await page.wait_for_selector(_JOB_CONTAINER_SELECTOR, timeout=10000)
+        except PlaywrightTimeoutError:
+            pass # No known container appeared; read whatever has rendered by now.
+
+        # Prefer the job-description container; only read the whole body when no container is found.
+        container = page.locator(_JOB_CONTAINER_SELECTOR)
+        if await container.count() > 0:
+            web_text = await container.first.inner_text()
+        else:
+            web_text = await page.inner_text('body')
+    finally:
+        await page.close() # The browser is shared and long-lived, so a failed page must not leak its tab.
+
+    return clean_web_text(web_text)
 
 def json_writer():
     '''
@@ -227,8 +447,7 @@ def json_writer():
         "info": "Text:\nSkip to main content\n\nThis site uses cookies in order to provide you with the best browsing experience. By using this site, you agree to our use of cookies. Learn more about our Cookie Policy.\n\nDecline\nAccept Cookies\nSign In\nSwift Homepage\nSearch for Jobs\nAI/ML Security Engineer page is loaded\nAI/ML Security Engineer\nApply\nlocations\nManassas, United States\nLeiden area, Netherlands\nposted on\nPosted 25 Days Ago\njob requisition id\n2024-14041\n\nABOUT US\n\nWe’re the world’s leading provider of secure financial messaging services, headquartered in Belgium. We are the way the world moves value – across borders, through cities and overseas. No other organisation can address the scale, precision, pace and trust that this demands, and we’re proud to support the global economy.\xa0\n\nWe’re unique too. We were established to find a better way for the global financial community to move value – a reliable, safe and secure approach that the community can trust, completely. We’re always striving to be better and are constantly evolving in an ever-changing landscape, without undermining that trust. Five decades on, our vibrant community reflects the complexity and diversity of the financial ecosystem. We innovate diligently, test exhaustively, then implement fast. In a connected and exciting era, our mission has never been more relevant. Swift now has a presence in 200+ countries and legal territories to serve a community of more than 12,000 banks and financial institutions.\xa0\xa0\xa0\n\nWhat to expect:\nDesign, develop, and implement security frameworks and strategies to protect AI/ML models and their use, and related data, applications and systems from adversarial attacks and other security threats.\nDevelop standards and best practices for a secure use, development, deployment, and operationalization of AI/ML (predictive AI, generative AI and Large Language Models).\nAnalyze potential security risks in AI/ML applications, such as model poisoning, data leakage, and other adversarial machine learning threats, and define mitigations that can be effectively implemented.\nCollaborate with cross-functional teams to ensure AI/ML systems are integrated, deployed or leveraged with robust security practices throughout the development lifecycle of proprietary models, or through the implementation of pre-trained models, AI-based SaaS solutions, ...\nResearch and stay ahead of emerging security threats in AI/ML and propose innovative defense strategies.\nConduct security assessments and robustness testing of AI/ML models, with appropriate tooling, identifying weaknesses and providing recommendations for improvement.\nCollaborate with internal teams to ensure compliance with relevant regulations, standards, and security frameworks in AI/ML-related initiatives.\nProvide guidance and act as centre of expertise for business, technical, legal, privacy and risk teams on assessing risks and implementing controls for AI/ML projects.\nEffectively communicate complex AI/ML security assessments, risks, controls and mitigations to management, technical teams and non-technical stakeholders.\n\nWhat you need to be successful:\n\nUniversity degree in Computer Science, AI/ML, Cybersecurity or related field, or equivalent experience.\n8-10 years of relevant experience, including in AI/ML models development and deployment. \nProficiency in programming languages such as Python, Java, or C++, and in AI/ML frameworks and libraries such as TensorFlow, PyTorch, scikit-learn, Keras, and XGBoost.\nStrong understanding of security concepts, including secure coding practices, threat modeling, and risk assessment.\nExpertise in securing AI/ML systems, including protection against adversarial attacks, data poisoning, ensuring the integrity of model training and inference processes, confidentiality of model and trained data.\nStrong analytical and problem-solving skills, attention to detail, and ability to work in a collaborative team environment.\nExcellent communication skills, including the ability to translate complex technical information for a non-technical audience.\n\nWhat we offer\n\nWe put you in control of career\n\nWe give you a competitive package\n\nWe help you perform at your best\n\nWe help you make a difference\n\nWe give you the freedom to be yourself\n\nWe give you the freedom to be yourself. We are creating an environment of unique individuals – like you – with different perspectives on the financial industry and the world. A diverse and inclusive environment in which everyone’s voice counts and where you can reach your full potential.\n\nIf you believe you require a reasonable accommodation to participate in the job application or interview process, please contact us to request accommodation.\n\nDon’t meet every single requirement? At Swift, we are dedicated to building a workplace where people can bring their full selves and ideas to the team, so if you are excited about this role, we encourage you to apply even if you do not meet every single qualification.\n\nSimilar Jobs (5)\nSecurity Architect\nlocations\n2 Locations\ntime type\nFull time\nposted on\nPosted 17 Days Ago\nPKI Security Architect\nlocations\n2 Locations\nposted on\nPosted Yesterday\nHybrid Platform Security Architect\nlocations\nManassas, United States\nposted on\nPosted 16 Days Ago\nView All 5 Jobs\nLoading\nFollow Us\n© 2025 Workday, Inc. All rights reserved.\n\nOutput:\nResponsibilities:\n- Design, develop, and implement security frameworks and strategies to protect AI/ML models and their use, and related data, applications and systems from adversarial attacks and other security threats.\n- Develop standards and best practices for a secure use, development, deployment, and operationalization of AI/ML (predictive AI, generative AI and Large Language Models).\n- Analyze potential security risks in AI/ML applications, such as model poisoning, data leakage, and other adversarial machine learning threats, and define mitigations that can be effectively implemented.\n- Collaborate with cross-functional teams to ensure AI/ML systems are integrated, deployed or leveraged with robust security practices throughout the development lifecycle of proprietary models, or through the implementation of pre-trained models, AI-based SaaS solutions, ...\n- Research and stay ahead of emerging security threats in AI/ML and propose innovative defense strategies.\n- Conduct security assessments and robustness testing of AI/ML models, with appropriate tooling, identifying weaknesses and providing recommendations for improvement.\n- Collaborate with internal teams to ensure compliance with relevant regulations, standards, and security frameworks in AI/ML-related initiatives.\n- Provide guidance and act as centre of expertise for business, technical, legal, privacy and risk teams on assessing risks and implementing controls for AI/ML projects.\n- Effectively communicate complex AI/ML security assessments, risks, controls and mitigations to management, technical teams and non-technical stakeholders.\n\nRequirements:\n- University degree in Computer Science, AI/ML, Cybersecurity or related field, or equivalent experience.\n- 8-10 years of relevant experience, including in AI/ML models development and deployment. \n- Proficiency in programming languages such as Python, Java, or C++, and in AI/ML frameworks and libraries such as TensorFlow, PyTorch, scikit-learn, Keras, and XGBoost.\n- Strong understanding of security concepts, including secure coding practices, threat modeling, and risk assessment.\n- Expertise in securing AI/ML systems, including protection against adversarial attacks, data poisoning, ensuring the integrity of model training and inference processes, confidentiality of model and trained data.\n- Strong analytical and problem-solving skills, attention to detail, and ability to work in a collaborative team environment.\n- Excellent communication skills, including the ability to translate complex technical information for a non-technical audience.",        
         "compare":"Job Description:\n\nResponsibilities:\n- Design, develop, and implement security frameworks for AI/ML models.\n- Collaborate with cross-functional teams for AI/ML security.\n- Conduct security assessments for AI/ML systems.\n\nRequirements:\n- 8-10 years of experience in AI/ML.\n- Expertise in Python, TensorFlow, and security concepts for AI/ML systems.\n- Data Leakage\n- Master's or a University degree in Computer Science or related field, or equivalent experience.\n- PySpark\n- SQL\n- LLM\n\nCV:\n- Skills: Python, TensorFlow, Data Security, Threat Modeling, AI/ML, Pytorch, Scikit-Learn\n- Experience: AI/ML development, Security of AI/ML models, Threat modeling expertise, collaborative, Image Processing, Computer Vision, Vision Transformer, \n- Education: PhD in Artificial Intellgience\n\nOutput:\nThe Semantic Similarity Percentage: 72.5%\n\nSimilar keywords:\n- Python\n- Tensorflow\n- AI/ML\n- Security\n- collaboration\n- PhD\n\nDifferent keywords:\n- Data Leakage\n- SQL\n- PySpark\n- LLM\n\nThe Similarity percentage between the similar and different keywords: 66%"}
     
-    with open('examples.json','w') as j_file:
-        json.dump(data,j_file,indent=4)
+    Path('examples.json').write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 def json_loader(file_address):
     '''
@@ -241,18 +460,80 @@ def json_loader(file_address):
     -----
         json_file(dict): examples for an LLM model.
     '''
-    with open(file_address, 'r') as j_file:
-        return(json.load(j_file))
+    return orjson.loads(Path(file_address).read_bytes())
 
-if __name__ == '__main__':
+MAX_CONCURRENT_REQUESTS = 3 # Keeps the fan-out under the OpenRouter per-minute quota.
+
+async def process(url, client, model_examples, my_cv, model_type, semaphore):
+    '''
+    Evaluating one job position against the CV.
+
+    Parameters:
+    -----
+        url (str): The Job position URL.
+        client (openai object): An instance of the AsyncOpenAI API client.
+        model_examples (dict): The examples for the shot learning.
+        my_cv (str): The CV content in markdown.
+        model_type (str): The model's name.
+        semaphore (asyncio.Semaphore): Bounds how many positions are processed at once.
+
+    Returns:
+    -----
+        comparison (str): The model's comparison of the CV and the job.
+    '''
+
+    async with semaphore:
+        # One failing URL must not take down the rest of the batch running in the same gather.
+        try:
+            print(f'\nParsing the information from the link {url}...')
+            web_texts = await run_playwright(url)
+
+            print('Making the comparison...\n')
+            # One fused call extracts the job info and compares it with the CV, instead of two dependent round trips.
+            comparison = await payload(text = f"""
+                                Job Description:
+                                {web_texts}
+                                CV:
+                                {my_cv}""",
+                                model = model_type,
+                                example = f"{model_examples['info']}\n\n{model_examples['compare']}",
+                                client = client,
+                                mode = 2)
+
+            return comparison
+
+        except Exception as e:
+            print(f"Error occurred while processing {url}: {e}")
+            return f"Could not evaluate the position at {url}."
+
+async def main():
+    '''
+    Running the whole comparison pipeline.
+
+    Parameters:
+    -----
+        None
+    Returns:
+    -----
+        None
+    '''
     args = parse_argument()
-    API_Key = 'Insert Your API key Here'
+    # The key is never kept in the source file; it comes from the environment or the command line.
+    API_Key = args.api_key or os.environ.get('OPENROUTER_API_KEY')
+    if not API_Key:
+        print('No API key was found. Set the OPENROUTER_API_KEY environment variable or pass --api_key.')
+        quit()
     api_url = 'https://openrouter.ai/api/v1'
     learning_mode = args.learn_mode
 
-    client = openai.OpenAI(
+    # HTTP/2 multiplexes all concurrent requests over one TLS connection to openrouter.ai,
+    # avoiding a TCP+TLS handshake per in-flight request.
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=2,
+                                         limits=httpx.Limits(max_connections=64, max_keepalive_connections=32))
+    client = openai.AsyncOpenAI(
         base_url=api_url,
-        api_key=API_Key
+        api_key=API_Key,
+        http_client=httpx.AsyncClient(transport=transport, timeout=60)
         )
     model_type = args.model_type # Various models can be chosen.
 
@@ -264,44 +545,55 @@ if __name__ == '__main__':
 
     #Extracting info from the CV
     cv_address = args.cv
-    
+
     if cv_address.startswith("http://") or cv_address.startswith("https://"):
-        response = requests.get(cv_address)
+        cv_url = cv_address
         cv_address = cv_address.split('/')[-1]
-        with open(cv_address, 'wb') as f:
-            f.write(response.content)
+        # Streaming the download keeps memory flat and overlaps network with disk I/O.
+        with requests.get(cv_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with open(cv_address, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1<<20)
     elif not os.path.exists(cv_address):
         print(f"The file {cv_address} does not exist.")
         quit()
-    
+
     print('\nParsing the information from the CV...')
-    my_cv = pymupdf4llm.to_markdown(cv_address) #Extracting information from the CV using an LLM model 
 
-    while True:
-        
-        #Extracting Job info from the link
-        position_url = input('\nEnter the link of the Positon ( or just enter to quite):\n')
-        if position_url == '':
-            quit()
-        
-        print('\nParsing the information from the link...')
-        web_texts = run_playwright(position_url)
-
-        web_info = payload(text = web_texts,
-                        model = model_type,
-                        example = model_examples['info'],
-                        client = client,
-                        mode = 0)
-
-        print('Making the comparison...\n')
-        comparison = payload(text = f"""
-                            Job Description:
-                            {web_info}
-                            CV:
-                            {my_cv}""",
-                            model = model_type,
-                            example = model_examples['compare'],
-                            client = client,
-                            mode = 1)
-        
-        print(comparison)
+    # The markdown conversion is cached on the CV content, so an unchanged CV is only parsed once across runs.
+    with open(cv_address, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest() # blake2b is enough, no cryptographic property is needed.
+    cv_cache = diskcache.Cache('.cv_cache')
+
+    my_cv = cv_cache.get(digest)
+    if my_cv is None:
+        my_cv = pymupdf4llm.to_markdown(cv_address) #Extracting information from the CV using an LLM model
+        cv_cache.set(digest, my_cv)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    #Collecting the position URLs given on the command line (if any).
+    position_urls = list(args.url) if args.url else []
+    if args.positions:
+        with open(args.positions, 'r') as file:
+            position_urls += [line.strip() for line in file.readlines() if line.strip()]
+
+    try:
+        if position_urls: # All positions are evaluated concurrently.
+            results = await asyncio.gather(*(process(url, client, model_examples, my_cv, model_type, semaphore)
+                                             for url in position_urls))
+            for comparison in results:
+                print(comparison)
+        else: # No URLs were given, so the positions are asked one by one.
+            while True:
+                position_url = input('\nEnter the link of the Positon ( or just enter to quite):\n')
+                if position_url == '':
+                    break
+
+                comparison = await process(position_url, client, model_examples, my_cv, model_type, semaphore)
+                print(comparison)
+    finally:
+        await close_browser()
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+File: llm_cache.py
+Author: Ali Reza (ARO) Omrani
+Email: omrani.alireza95@gmail.com
+Date: 29th August 2026
+
+Description:
+------
+This file keeps a persistent cache of LLM responses on disk, so re-running the script
+on the same CV and job position does not pay for the same completions again.
+The cache key covers the model, the messages, and the expected output structure,
+so any change in the prompt leads to a fresh request.
+
+Functions:
+- make_key(model, messages, response_format): Builds the cache key for one request.
+- get_response(key): Reads a cached response.
+- store_response(key, result): Writes a response to the cache.
+
+Requirements:
+------
+- diskcache
+- hashlib
+- orjson
+"""
+import hashlib
+import orjson
+
+import diskcache
+
+CACHE_EXPIRE_SECONDS = 7 * 86400 # Cached responses are kept for a week.
+
+_cache = diskcache.Cache('.llm_cache')
+
+def make_key(model, messages, response_format):
+    '''
+    Building the cache key for one request.
+
+    Parameters:
+    -----
+        model (str): The model's name.
+        messages (list): The messages sent to the model.
+        response_format (dict): The expected output structure.
+
+    Returns:
+    -----
+        key (str): A hash of the full request.
+    '''
+    request = orjson.dumps({'model': model,
+                            'messages': messages,
+                            'response_format': response_format}, option=orjson.OPT_SORT_KEYS)
+
+    return hashlib.sha256(request).hexdigest()
+
+def get_response(key):
+    '''
+    Reading a cached response.
+
+    Parameters:
+    -----
+        key (str): The cache key of the request.
+
+    Returns:
+    -----
+        result (str or None): The cached response, or None when the request was never seen.
+    '''
+    return _cache.get(key)
+
+def store_response(key, result):
+    '''
+    Writing a response to the cache.
+
+    Parameters:
+    -----
+        key (str): The cache key of the request.
+        result (str): The model's response.
+
+    Returns:
+    -----
+        None
+    '''
+    _cache.set(key, result, expire=CACHE_EXPIRE_SECONDS)